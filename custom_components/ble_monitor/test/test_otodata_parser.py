@@ -48,7 +48,34 @@ class TestOtodata(TestCase):
         
         # Log for debugging
         _LOGGER.info("Parsed sensor data: %s", sensor_msg)
-        
+
+    def test_otodata_ototele(self):
+        """Test Otodata OTOTELE telemetry packet."""
+        data_string = "043e270201000002bc609010ea1b1affb1034f544f54454c459060bc1c1018210384060304b0130205c4"
+        data = bytes(bytearray.fromhex(data_string))
+        # pylint: disable=unused-variable
+        ble_parser = BleParser()
+        sensor_msg, tracker_msg = ble_parser.parse_raw_data(data)
+
+        assert sensor_msg["firmware"] == "Otodata"
+        assert sensor_msg["type"] == "Propane Tank Monitor"
+        assert sensor_msg["mac"] == "EA109060BC02"
+        assert sensor_msg["packet"] == "no packet id"
+        assert sensor_msg["data"]
+        assert sensor_msg["tank level"] == 72
+        assert sensor_msg["rssi"] == -60
+
+    def test_otodata_ototele_tank_level_clamped(self):
+        """Test Otodata OTOTELE packet with an out of range empty percentage."""
+        data_string = "043e270201000003bc609010ea1b1affb1034f544f54454c459060bcff1018210384060304b0130205c4"
+        data = bytes(bytearray.fromhex(data_string))
+        # pylint: disable=unused-variable
+        ble_parser = BleParser()
+        sensor_msg, tracker_msg = ble_parser.parse_raw_data(data)
+
+        assert sensor_msg["mac"] == "EA109060BC03"
+        assert sensor_msg["tank level"] == 0
+
     def test_otodata_invalid_data(self):
         """Test Otodata parser with invalid/short data."""
         # Test with data that's too short